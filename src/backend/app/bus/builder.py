@@ -91,8 +91,11 @@ def create_handler_factory[D: Dependency](
     handler: type[HandlerType],
     **dependencies: D,
 ) -> Callable[[], HandlerType]:
+    factories = {k: v for k, v in dependencies.items() if callable(v)}
+    values = {k: v for k, v in dependencies.items() if k not in factories}
+
     def _factory() -> HandlerType:
-        return handler(**{k: v() if callable(v) else v for k, v in dependencies.items()})
+        return handler(**values, **{k: v() for k, v in factories.items()})
 
     return _factory
 
@@ -2,10 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections import defaultdict
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from typing import TYPE_CHECKING, Any, cast
 
+from backend.app.common.tools import singleton
 from backend.app.contracts.dto import DTO
 
 from .interfaces.bus import AwaitableProxy
@@ -19,20 +19,26 @@ if TYPE_CHECKING:
     from .builder import BusBuilder
 
 type HandlerLike = Callable[[], HandlerType] | HandlerType
-type EventHandlerLike = Callable[[], EventHandler[Any]] | EventHandler[Any]
+type HandlerFactory = Callable[[], HandlerType]
+type EventHandlerFactory = Callable[[], EventHandler[Any]]
 logger = logging.getLogger(__name__)
 
 
 class UnregisteredHandlerError(Exception): ...
 
 
-def _resolve_factory[T](v: Callable[[], T] | T, compare_with: type[Any]) -> T:
-    return v if isinstance(v, compare_with) or not callable(v) else v()
+def _as_factory[T](v: Callable[[], T] | T, compare_with: type[Any]) -> Callable[[], T]:
+    return singleton(v) if isinstance(v, compare_with) or not callable(v) else v
 
 
-async def _safe_invoke[E: Event](event: E, handler: EventHandler[E], /, **kw: Any) -> None:
+async def _safe_invoke[E: Event](
+    event: E,
+    handler: EventHandler[E],
+    kw: Mapping[str, Any],
+    /,
+) -> None:
     try:
-        await handler(event, **kw)
+        await (handler(event, **kw) if kw else handler(event))
     except Exception as e:
         logger.exception(
             "Error occurred in handler: %s\nError: %s -> %s",
@@ -44,31 +50,53 @@ async def _safe_invoke[E: Event](event: E, handler: EventHandler[E], /, **kw: An
 
 class QCBus:
     __slots__ = (
+        "_chains",
         "_data",
-        "_dispatch_fn",
+        "_middlewares",
     )
 
     def __init__(self, *middlewares: MiddlewareType) -> None:
-        self._data: dict[type[DTO], HandlerLike] = {}
-        self._dispatch_fn = self._make_dispatch(*middlewares)
+        self._data: dict[type[DTO], HandlerFactory] = {}
+        self._middlewares: tuple[MiddlewareType, ...] = middlewares
+        self._chains: dict[type[DTO], HandlerType] = {}
+
+    def _make_dispatch(self, qc: type[DTO]) -> HandlerType:
+        factory = self._data[qc]
 
-    def _make_dispatch(self, *middlewares: MiddlewareType) -> HandlerType:
         async def dispatch[T, Q: DTO, R](context: T, qce: Q, /) -> R:
-            handler: Handler[T, Q, R] = self._get_handler(qce)
+            handler: Handler[T, Q, R] = factory()
 
             return await handler(context, qce)
 
-        return cast(HandlerType, wrap_middleware(dispatch, *middlewares))
+        if not self._middlewares:
+            return cast(HandlerType, dispatch)
+
+        return cast(HandlerType, wrap_middleware(dispatch, *self._middlewares))
+
+    def _get_chain(self, qc: DTO) -> HandlerType:
+        qc_type = type(qc)
+        chain = self._chains.get(qc_type)
+        if chain is None:
+            if qc_type not in self._data:
+                raise UnregisteredHandlerError(f"Handler for `{qc_type}` is not registered")
+
+            chain = self._chains[qc_type] = self._make_dispatch(qc_type)
+
+        return chain
+
+    def _dispatch(self, context: Any, qc: DTO, /) -> Any:
+        return self._get_chain(qc)(context, qc)
 
     def __call__[T, Q: DTO, R](self, context: T, qc: Q, /) -> AwaitableProxy[Handler[T, Q, R]]:
-        return AwaitableProxy(self._dispatch_fn, context, qc)
+        return AwaitableProxy(cast(HandlerType, self._dispatch), context, qc)
 
     def register[T, Q: DTO, R](
         self,
         qc: type[Q],
         handler: Callable[[], Handler[T, Q, R]] | Handler[T, Q, R],
     ) -> QCBus:
-        self._data[qc] = handler
+        self._data[qc] = _as_factory(handler, Handler)
+        self._chains.pop(qc, None)
 
         return self
 
@@ -81,10 +109,12 @@ class QCBus:
         return AwaitableProxy(self._get_handler(qc), context, qc)
 
     def _get_handler[T, Q: DTO, R](self, qc: Q) -> Handler[T, Q, R]:
-        try:
-            return _resolve_factory(self._data[type(qc)], Handler)
-        except KeyError as e:
-            raise UnregisteredHandlerError(f"Handler for `{type(qc)}` is not registered") from e
+        qc_type = type(qc)
+        factory = self._data.get(qc_type)
+        if factory is None:
+            raise UnregisteredHandlerError(f"Handler for `{qc_type}` is not registered")
+
+        return factory()
 
     @staticmethod
     def builder() -> BusBuilder:
@@ -102,17 +132,25 @@ class AnyEventMarker:
 
 
 class EventBus:
-    __slots__ = ("_events",)
+    __slots__ = (
+        "_any_handlers",
+        "_events",
+    )
 
     def __init__(self) -> None:
-        self._events: defaultdict[type[Event], list[EventHandlerLike]] = defaultdict(list)
+        self._any_handlers: list[EventHandlerFactory] = []
+        self._events: dict[type[Event], list[EventHandlerFactory]] = {
+            AnyEventMarker: self._any_handlers
+        }
 
     def register[E: Event](
         self,
         event_type: type[E],
         *handlers: Callable[[], EventHandler[E]] | EventHandler[E],
     ) -> EventBus:
-        self._events[event_type].extend(handlers)
+        self._events.setdefault(event_type, []).extend(
+            _as_factory(h, EventHandler) for h in handlers
+        )
 
         return self
 
@@ -125,10 +163,14 @@ class EventBus:
         return self
 
     async def publish[E: Event](self, event: E, /, **kw: Any) -> None:
-        handlers = self._events.get(type(event), []) or self._events.get(AnyEventMarker, [])
+        handlers = self._events.get(type(event)) or self._any_handlers
         if not handlers:
             return
 
-        asyncio.gather(
-            *(_safe_invoke(event, _resolve_factory(task, EventHandler), **kw) for task in handlers)
-        )
+        if len(handlers) == 1:
+            await _safe_invoke(event, handlers[0](), kw)
+            return
+
+        async with asyncio.TaskGroup() as tg:
+            for factory in handlers:
+                tg.create_task(_safe_invoke(event, factory(), kw))
@@ -17,16 +17,14 @@ class AwaitableProxy[_: HandlerType]:
     )
 
     def __init__[T, Q: DTO, R](self, handler: Handler[T, Q, R], context: T, qce: Q) -> None:
-        self._handler = handler
+        self._handler: HandlerType = handler
         self._context = context
         self._qte = qce
 
     def __await__[T, Q: DTO, R](
         self: AwaitableProxy[Handler[T, Q, R]],
     ) -> Generator[Any, None, R]:
-        return (
-            yield from self._handler(self._context, self._qte).__await__()  # type: ignore[return-value]
-        )
+        return self._handler(self._context, self._qte).__await__()
 
 
 @runtime_checkable
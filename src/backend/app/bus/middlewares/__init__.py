@@ -12,7 +12,7 @@ def wrap_middleware(
     *middlewares: MiddlewareType,
     **kw: Any,
 ) -> CallNextHandlerMiddlewareType:
-    middleware = partial(call_next, **kw)
+    middleware = partial(call_next, **kw) if kw else call_next
 
     for m in reversed(middlewares):
         middleware = partial(m, middleware)
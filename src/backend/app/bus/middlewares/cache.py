@@ -1,3 +1,4 @@
+import time
 from collections.abc import Callable
 from dataclasses import dataclass, field
 from typing import Final, override
@@ -6,7 +7,7 @@ from backend.app.bus.interfaces.middleware import (
     CallNextHandlerMiddlewareType,
     HandlerMiddleware,
 )
-from backend.app.common.tools import msgspec_encoder
+from backend.app.common.tools import msgspec_bytes_encoder
 from backend.app.contracts.auth import Context
 from backend.app.contracts.cache import StrCache
 from backend.app.contracts.dto import DTO
@@ -15,15 +16,32 @@ from backend.app.contracts.dto import DTO
 EPOCH_KEY: Final[str] = "cache:epoch"
 
 
+@dataclass(slots=True)
+class CacheEpoch:
+    cache: StrCache
+    ttl: float = field(default=1)
+    _value: int = field(default=0, init=False)
+    _expires_at: float = field(default=0, init=False)
+
+    async def get(self) -> int:
+        if time.monotonic() >= self._expires_at:
+            self._value = int(v) if (v := await self.cache.get(EPOCH_KEY)) else 0
+            self._expires_at = time.monotonic() + self.ttl
+
+        return self._value % 1_000_000
+
+    async def bump(self) -> None:
+        self._value = await self.cache.increment(EPOCH_KEY)
+        self._expires_at = time.monotonic() + self.ttl
+
+
 @dataclass(frozen=True, slots=True)
 class CacheMiddleware(HandlerMiddleware[Context]):
     cache: StrCache
     cache_key_builder: Callable[[Context], str]
+    epoch: CacheEpoch
     cache_time: float = field(default=60)
 
-    async def _epoch(self) -> int:
-        return (int(v) if (v := await self.cache.get(EPOCH_KEY)) else 0) % 1_000_000
-
     @override
     async def __call__[Q: DTO, R](
         self,
@@ -32,21 +50,21 @@ class CacheMiddleware(HandlerMiddleware[Context]):
         qce: Q,
         /,
     ) -> R:
-        key = f"{await self._epoch()}:{self.cache_key_builder(context)}"
+        key = f"{await self.epoch.get()}:{self.cache_key_builder(context)}"
         if value := await self.cache.get(key):
             return value  # type: ignore[return-value]
 
         result: R = await call_next(context, qce)
 
         if result:
-            await self.cache.set(key, msgspec_encoder(result), expire=self.cache_time)
+            await self.cache.set(key, msgspec_bytes_encoder(result), expire=self.cache_time)
 
         return result
 
 
 @dataclass(frozen=True, slots=True)
 class CacheInvalidateMiddleware(HandlerMiddleware[Context]):
-    cache: StrCache
+    epoch: CacheEpoch
 
     @override
     async def __call__[Q: DTO, R](
@@ -58,6 +76,6 @@ class CacheInvalidateMiddleware(HandlerMiddleware[Context]):
     ) -> R:
         result: R = await call_next(context, qce)
 
-        await self.cache.increment(EPOCH_KEY)
+        await self.epoch.bump()
 
         return result
@@ -24,6 +24,15 @@ DEFAULT_CONVERT_TO_TYPES: Final[tuple[type, ...]] = (
     Decimal,
 )
 DEFAULT_CONVERT_FROM_TYPES: Final[tuple[type, ...]] = (*DEFAULT_CONVERT_TO_TYPES, memoryview)
+_JSON_ENCODER: Final[msgspec.json.Encoder] = msgspec.json.Encoder(
+    decimal_format="string",
+    uuid_format="canonical",
+)
+_JSON_DECODER: Final[msgspec.json.Decoder[Any]] = msgspec.json.Decoder()
+_MSGPACK_ENCODER: Final[msgspec.msgpack.Encoder] = msgspec.msgpack.Encoder()
+_MSGPACK_DECODER: Final[msgspec.msgpack.Decoder[Any]] = msgspec.msgpack.Decoder(strict=False)
+_JSON_DECODERS: Final[dict[tuple[Any, bool], msgspec.json.Decoder[Any]]] = {}
+_MSGPACK_DECODERS: Final[dict[tuple[Any, bool], msgspec.msgpack.Decoder[Any]]] = {}
 
 
 def convert_to[T](cls: type[T], value: Any, **kw: Any) -> T:
@@ -43,24 +52,56 @@ def convert_from(value: Any, **kw: Any) -> Any:
 
 
 def msgpack_encoder(obj: Any, *args: Any, **kw: Any) -> bytes:
-    return msgspec.msgpack.encode(obj, *args, **kw)
+    if args or kw:
+        return msgspec.msgpack.encode(obj, *args, **kw)
+
+    return _MSGPACK_ENCODER.encode(obj)
 
 
 def msgpack_decoder(obj: Any, *args: Any, **kw: Any) -> Any:
-    return msgspec.msgpack.decode(
-        obj,
-        *args,
-        strict=kw.pop("strict", False),
-        **kw,
-    )
+    if args or kw:
+        return msgspec.msgpack.decode(
+            obj,
+            *args,
+            strict=kw.pop("strict", False),
+            **kw,
+        )
+
+    return _MSGPACK_DECODER.decode(obj)
+
+
+def msgspec_bytes_encoder(obj: Any) -> bytes:
+    return _JSON_ENCODER.encode(obj)
 
 
 def msgspec_encoder(obj: Any, *args: Any, **kw: Any) -> str:
-    return msgspec.json.encode(obj, *args, **kw).decode(encoding="utf-8")
+    if args or kw:
+        return msgspec.json.encode(obj, *args, **kw).decode(encoding="utf-8")
+
+    return msgspec_bytes_encoder(obj).decode(encoding="utf-8")
 
 
 def msgspec_decoder(obj: Any, *args: Any, **kw: Any) -> Any:
-    return msgspec.json.decode(obj, *args, **kw)
+    if args or kw:
+        return msgspec.json.decode(obj, *args, **kw)
+
+    return _JSON_DECODER.decode(obj)
+
+
+def json_decoder_for[T](cls: type[T], *, strict: bool = True) -> msgspec.json.Decoder[T]:
+    decoder = _JSON_DECODERS.get((cls, strict))
+    if decoder is None:
+        decoder = _JSON_DECODERS[cls, strict] = msgspec.json.Decoder(cls, strict=strict)
+
+    return decoder
+
+
+def msgpack_decoder_for[T](cls: type[T], *, strict: bool = True) -> msgspec.msgpack.Decoder[T]:
+    decoder = _MSGPACK_DECODERS.get((cls, strict))
+    if decoder is None:
+        decoder = _MSGPACK_DECODERS[cls, strict] = msgspec.msgpack.Decoder(cls, strict=strict)
+
+    return decoder
 
 
 def singleton[T](value: T) -> Callable[[], T]:
@@ -74,35 +115,45 @@ type _AnyDependency = Callable[[], Any] | Any
 
 
 def lazy[T](v: Callable[..., T], *args: _AnyDependency, **deps: _AnyDependency) -> Callable[[], T]:
+    lazy_args = tuple((i, arg) for i, arg in enumerate(args) if callable(arg))
+    lazy_deps = {k: dep for k, dep in deps.items() if callable(dep)}
+    static_deps = {k: dep for k, dep in deps.items() if k not in lazy_deps}
+
     def _factory() -> T:
-        return v(
-            *(arg() if callable(arg) else arg for arg in args),
-            **{k: dep() if callable(dep) else dep for k, dep in deps.items()},
-        )
+        resolved = list(args)
+        for i, arg in lazy_args:
+            resolved[i] = arg()
+
+        return v(*resolved, **static_deps, **{k: dep() for k, dep in lazy_deps.items()})
 
     return _factory
 
 
 def lazy_single[T, D](v: Callable[[D], T], dep: Callable[[], D]) -> Callable[[], T]:
-    return lazy(v, dep)
+    def _factory() -> T:
+        return v(dep())
+
+    return _factory
 
 
 class ClosableProxy:
     __slots__ = (
         "_close_fn",
+        "_is_async",
         "_target",
     )
 
     def __init__(self, target: Any, close_fn: Callable[[], Any]) -> None:
         self._target = target
         self._close_fn = close_fn
+        self._is_async = inspect.iscoroutinefunction(close_fn)
 
     async def close(self) -> None:
-        if inspect.iscoroutinefunction(self._close_fn):
+        if self._is_async:
             await self._close_fn()
         else:
             res = self._close_fn()
-            if inspect.isawaitable(res):
+            if hasattr(res, "__await__"):
                 await res
 
     def __getattr__(self, key: str) -> Any:
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import enum
+import functools
 import uuid
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Literal, Protocol, overload, runtime_checkable
+from typing import Any, Literal, NewType, Protocol, overload
 
 from backend.app.contracts import exceptions as exc
 from backend.app.contracts.manager import TransactionManager
@@ -42,6 +43,11 @@ class Effect(enum.StrEnum):
     DENY = enum.auto()
 
 
+@functools.lru_cache(maxsize=1024)
+def _permission_key(resource: str, action: Action, operation: str) -> str:
+    return f"{resource}:{action.value}:{operation}".lower()
+
+
 @dataclass(slots=True, frozen=True)
 class PermissionSpec:
     resource: str
@@ -51,7 +57,7 @@ class PermissionSpec:
     fields: Mapping[Source, frozenset[str]] = field(default_factory=dict)
 
     def key(self) -> str:
-        return f"{self.resource}:{self.action.value}:{self.operation}".lower()
+        return _permission_key(self.resource, self.action, self.operation)
 
 
 @dataclass(slots=True, frozen=True, eq=False)
@@ -65,7 +71,7 @@ class Permission:
     allow_fields: Mapping[Source, frozenset[str]] = field(default_factory=dict)
 
     def key(self) -> str:
-        return f"{self.resource}:{self.action.value}:{self.operation}".lower()
+        return _permission_key(self.resource, self.action, self.operation)
 
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Permission):
@@ -92,9 +98,17 @@ class AuthUser:
 
 
 _SCALARS: tuple[type, ...] = (str, bytes, bytearray, memoryview)
+_BUILTIN_CONTAINERS: tuple[type, ...] = (dict, list, tuple)
+_BUILTIN_LEAVES: tuple[type, ...] = (*_SCALARS, int, float, bool, type(None))
 
 
 def _is_container(x: Any) -> bool:
+    cls = type(x)
+    if cls in _BUILTIN_CONTAINERS:
+        return True
+    if cls in _BUILTIN_LEAVES:
+        return False
+
     return isinstance(x, Mapping) or (isinstance(x, Sequence) and not isinstance(x, _SCALARS))
 
 
@@ -107,19 +121,27 @@ def _collect_keys(
         return frozenset()
 
     keys: set[str] = set()
-    stack: list[tuple[Any, int]] = [(data, 0)]
+    nodes: list[Any] = [data]
+    depths: list[int] = [0]
 
-    while stack:
-        current, depth = stack.pop()
+    while nodes:
+        current = nodes.pop()
+        depth = depths.pop()
 
         if max_depth is not None and depth > max_depth:
             raise ValueError("keys collection max_depth exceeded")
 
-        if isinstance(current, Mapping):
+        if type(current) is dict or isinstance(current, Mapping):
             keys.update(current.keys())
-            stack.extend((v, depth + 1) for v in current.values() if _is_container(v))
-        elif isinstance(current, Sequence) and not isinstance(current, _SCALARS):
-            stack.extend((v, depth + 1) for v in current if _is_container(v))
+            children = [v for v in current.values() if _is_container(v)]
+        elif _is_container(current):
+            children = [v for v in current if _is_container(v)]
+        else:
+            continue
+
+        if children:
+            nodes.extend(children)
+            depths.extend([depth + 1] * len(children))
 
     return frozenset(keys)
 
@@ -134,21 +156,29 @@ class Context:
     request_query_params: Mapping[str, Any] = field(default_factory=dict)
     request_json_params: Mapping[str, Any] = field(default_factory=dict)
     request_url: str | None = None
+    _keys: dict[str, frozenset[str]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
 
     def update_user(self, user: AuthUser) -> None:
         object.__setattr__(self, "user", user)
 
+    def _cached_keys(self, name: str, params: Mapping[str, Any]) -> frozenset[str]:
+        if (keys := self._keys.get(name)) is None:
+            keys = self._keys[name] = _collect_keys(params)
+
+        return keys
+
     def request_path_keys(self) -> frozenset[str]:
-        return _collect_keys(self.request_path_params)
+        return self._cached_keys("path", self.request_path_params)
 
     def request_query_keys(self) -> frozenset[str]:
-        return _collect_keys(self.request_query_params)
+        return self._cached_keys("query", self.request_query_params)
 
     def request_json_keys(self) -> frozenset[str]:
-        return _collect_keys(self.request_json_params)
+        return self._cached_keys("json", self.request_json_params)
 
 
-@runtime_checkable
 class Authenticator(Protocol):
     @overload
     async def authenticate(
@@ -164,6 +194,11 @@ class Authenticator(Protocol):
         *,
         user_id: uuid.UUID,
     ) -> AppResult[AuthUser]: ...
+    async def get_user_by_id(
+        self,
+        manager: TransactionManager,
+        user_id: uuid.UUID,
+    ) -> AppResult[AuthUser]: ...
     async def get_permission_for(
         self,
         user: AuthUser,
@@ -175,7 +210,7 @@ class Authenticator(Protocol):
 type TokenType = Literal["access", "refresh"]
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True, frozen=True)
 class TokenClaims:
     sub: str
     typ: TokenType
@@ -203,12 +238,7 @@ class JwtToken:
         return self.token
 
 
-@dataclass(slots=True, frozen=True)
-class Fingerprint:
-    fingerprint: str
-
-    def __str__(self) -> str:
-        return self.fingerprint
+Fingerprint = NewType("Fingerprint", str)
 
 
 @dataclass(slots=True, frozen=True)
@@ -218,7 +248,6 @@ class TokenPair:
     expires_in: int
 
 
-@runtime_checkable
 class JwtIssuer(Protocol):
     def issue_pair(
         self,
@@ -233,7 +262,6 @@ class JwtIssuer(Protocol):
     ) -> AppResult[TokenPair]: ...
 
 
-@runtime_checkable
 class JwtVerifier(Protocol):
     def verify(
         self,
@@ -243,7 +271,6 @@ class JwtVerifier(Protocol):
     ) -> AppResult[TokenClaims]: ...
 
 
-@runtime_checkable
 class RefreshStore(Protocol):
     async def make_token(
         self,
@@ -254,7 +281,6 @@ class RefreshStore(Protocol):
     async def revoke(self, fingerprint: Fingerprint, token: JwtToken) -> AppResult[bool]: ...
 
 
-@runtime_checkable
 class Hasher(Protocol):
-    def hash_password(self, plain: str) -> AppResult[str]: ...
-    def verify_password(self, hashed: str, plain: str) -> AppResult[bool]: ...
+    async def hash_password(self, plain: str) -> AppResult[str]: ...
+    async def verify_password(self, hashed: str, plain: str) -> AppResult[bool]: ...
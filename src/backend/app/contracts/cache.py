@@ -24,4 +24,16 @@ class Cache[K, V](Protocol):
 
 
 @runtime_checkable
-class StrCache(Cache[str, str], Protocol): ...
+class StrCache(Cache[str, str], Protocol):
+    async def set(
+        self,
+        key: str,
+        value: str | bytes,
+        expire: float | timedelta | None = None,
+    ) -> None: ...
+    async def set_nx(
+        self,
+        key: str,
+        value: str,
+        expire: float | timedelta | None = None,
+    ) -> bool: ...
@@ -16,7 +16,7 @@ class AppError(Exception):
             self.content["code"] = code
 
     def as_dict(self) -> dict[str, Any]:
-        return {"content": self.content.copy()}
+        return {"content": self.content}
 
     @property
     def raw_message(self) -> str:
@@ -1,10 +1,9 @@
-from typing import Protocol, runtime_checkable
+from typing import Protocol
 
 from .manager import TransactionManager
 from .repositories import RbacRepository, UserRepository
 
 
-@runtime_checkable
 class RepositoryGateway(Protocol):
     @property
     def manager(self) -> TransactionManager: ...
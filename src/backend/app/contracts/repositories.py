@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 from collections.abc import Sequence
-from typing import TYPE_CHECKING, Protocol, Unpack, runtime_checkable
+from typing import TYPE_CHECKING, Protocol, Unpack
 
 from .auth import Permission as AuthPermission
 from .pagination import OffsetPaginationResult, SortOrder
@@ -14,7 +14,6 @@ if TYPE_CHECKING:
     from backend.app import dto
 
 
-@runtime_checkable
 class UserRepository(Protocol):
     async def get_one(
         self,
@@ -39,7 +38,6 @@ class UserRepository(Protocol):
     ) -> AppResult[dto.user.UserPublic]: ...
 
 
-@runtime_checkable
 class RbacRepository(Protocol):
     async def create_role(
         self,
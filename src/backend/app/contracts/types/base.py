@@ -1,13 +1,9 @@
-from dataclasses import asdict, dataclass
 from typing import Any
 
+import msgspec
 
-def _filter_none(values: list[tuple[str, Any]]) -> dict[str, Any]:
-    return {k: v for k, v in values if v is not None}
 
-
-@dataclass(slots=True)
-class BaseData:
+class BaseData(msgspec.Struct):
     def __post_init__(self) -> None:
         self._validate()
 
@@ -15,4 +11,6 @@ class BaseData:
         return
 
     def as_dict(self, *, exclude_none: bool = True) -> dict[str, Any]:
-        return asdict(self) if not exclude_none else asdict(self, dict_factory=_filter_none)
+        values = msgspec.structs.asdict(self)
+
+        return values if not exclude_none else {k: v for k, v in values.items() if v is not None}
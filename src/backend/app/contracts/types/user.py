@@ -1,6 +1,5 @@
 import re
 import uuid
-from dataclasses import dataclass
 from datetime import date
 from typing import Final, TypedDict, override
 
@@ -11,14 +10,18 @@ from .base import BaseData
 
 MIN_PASSWORD_LENGTH: Final[int] = 8
 MAX_PASSWORD_LENGTH: Final[int] = 32
+MAX_EMAIL_LENGTH: Final[int] = 254
 EMAIL_REGEX: Final[re.Pattern[str]] = re.compile(
-    r"^[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+)*@"
+    r"^[A-Za-z0-9.!#$%&'*+/=?^_`{|}~-]+@"
     r"(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+"
     r"[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])$",
 )
 
 
-@dataclass(slots=True)
+def is_valid_email(value: str) -> bool:
+    return len(value) <= MAX_EMAIL_LENGTH and "@" in value and EMAIL_REGEX.match(value) is not None
+
+
 class CreateUserData(BaseData):
     email: str
     password: str
@@ -31,11 +34,10 @@ class CreateUserData(BaseData):
                 f"and {MAX_PASSWORD_LENGTH} characters",
             )
 
-        if not EMAIL_REGEX.match(self.email):
+        if not is_valid_email(self.email):
             raise exc.BadRequestError("Invalid email address")
 
 
-@dataclass(slots=True)
 class UpdateUserData(BaseData):
     email: str | None = None
     password: str | None = None
@@ -50,7 +52,7 @@ class UpdateUserData(BaseData):
                 f"and {MAX_PASSWORD_LENGTH} characters",
             )
 
-        if self.email is not None and not EMAIL_REGEX.match(self.email):
+        if self.email is not None and not is_valid_email(self.email):
             raise exc.BadRequestError("Invalid email address")
 
 
@@ -6,9 +6,9 @@ import msgspec
 from backend.app.common.tools import (
     convert_from,
     convert_to,
-    msgpack_decoder,
+    json_decoder_for,
+    msgpack_decoder_for,
     msgpack_encoder,
-    msgspec_decoder,
     msgspec_encoder,
 )
 
@@ -20,7 +20,7 @@ class BaseDTO(msgspec.Struct):
 
     @classmethod
     def from_string(cls, value: str) -> Self:
-        return convert_to(cls, msgspec_decoder(value, strict=False), strict=False)
+        return json_decoder_for(cls, strict=False).decode(value)
 
     @classmethod
     def from_attributes(cls, value: Any) -> Self:
@@ -28,7 +28,7 @@ class BaseDTO(msgspec.Struct):
 
     @classmethod
     def from_bytes(cls, value: bytes) -> Self:
-        return convert_to(cls, msgpack_decoder(value, strict=False), strict=False)
+        return msgpack_decoder_for(cls, strict=False).decode(value)
 
     def as_mapping(
         self,
@@ -70,7 +70,7 @@ class StrictBaseDTO(BaseDTO):
     @override
     @classmethod
     def from_string(cls, value: str) -> Self:
-        return convert_to(cls, msgspec_decoder(value, strict=True), strict=True)
+        return json_decoder_for(cls, strict=True).decode(value)
 
     @override
     @classmethod
@@ -80,4 +80,4 @@ class StrictBaseDTO(BaseDTO):
     @override
     @classmethod
     def from_bytes(cls, value: bytes) -> Self:
-        return convert_to(cls, msgpack_decoder(value, strict=True), strict=True)
+        return msgpack_decoder_for(cls, strict=True).decode(value)
@@ -5,7 +5,8 @@ from datetime import datetime
 
 from msgspec import field
 
-from backend.app.contracts.types.user import EMAIL_REGEX
+from backend.app.contracts.auth import Fingerprint
+from backend.app.contracts.types.user import is_valid_email
 
 from . import rbac
 from .base import ExcludeDefaultsDTO
@@ -22,18 +23,18 @@ class UserPublic(ExcludeDefaultsDTO):
 
 
 class LoginUser(ExcludeDefaultsDTO):
-    fingerprint: str
+    fingerprint: Fingerprint
     email: str
     password: str
 
     def __post_init__(self) -> None:
-        if not EMAIL_REGEX.match(self.email):
+        if not is_valid_email(self.email):
             raise ValueError("Invalid email address")
 
 
 class LogoutUser(ExcludeDefaultsDTO):
-    fingerprint: str
+    fingerprint: Fingerprint
 
 
 class RefreshUser(ExcludeDefaultsDTO):
-    fingerprint: str
+    fingerprint: Fingerprint
@@ -1,4 +1,4 @@
-from typing import Any, Protocol, overload, runtime_checkable
+from typing import Any, Protocol, overload
 
 from backend.app.bus.interfaces.bus import AwaitableProxy
 from backend.app.bus.interfaces.handler import Handler
@@ -14,7 +14,6 @@ __all__ = (
 )
 
 
-@runtime_checkable
 class CommandBus(Protocol):
     # rbac
     @overload
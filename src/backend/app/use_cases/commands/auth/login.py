@@ -6,7 +6,6 @@ from backend.app.contracts import exceptions as exc
 from backend.app.contracts.auth import (
     Authenticator,
     Context,
-    Fingerprint,
     Hasher,
     RefreshStore,
     TokenPair,
@@ -33,14 +32,15 @@ class LoginUserCommandHandler(Handler[Context, LoginUserCommand, TokenPair]):
         async with self.gateway.manager as manager:
             result = await self.authenticator.authenticate(manager, email=qc.data.email)
 
-        user_id = result.and_then(
-            lambda u: u
-            if u.password and self.hasher.verify_password(u.password, qc.data.password).unwrap()
-            else None
-        ).unwrap_or_raise(exc.UnAuthorizedError("Invalid credentials"))
+        user = result.unwrap_or_raise(exc.UnAuthorizedError("Invalid credentials"))
+        if (
+            not user.password
+            or not (await self.hasher.verify_password(user.password, qc.data.password)).unwrap()
+        ):
+            raise exc.UnAuthorizedError("Invalid credentials")
 
         return (
-            (await self.refresh_store.make_token(user_id.id, Fingerprint(qc.data.fingerprint)))
+            (await self.refresh_store.make_token(user.id, qc.data.fingerprint))
             .map_err(exc.ServiceNotImplementedError.from_other)
             .unwrap()
         )
@@ -4,7 +4,6 @@ from backend.app import dto
 from backend.app.bus.interfaces.handler import Handler
 from backend.app.contracts.auth import (
     Context,
-    Fingerprint,
     JwtToken,
     RefreshStore,
 )
@@ -22,6 +21,6 @@ class LogoutUserCommandHandler(Handler[Context, LogoutUserCommand, dto.Status]):
 
     @override
     async def __call__(self, ctx: Context, qc: LogoutUserCommand, /) -> dto.Status:
-        result = await self.refresh_store.revoke(Fingerprint(qc.data.fingerprint), qc.token)
+        result = await self.refresh_store.revoke(qc.data.fingerprint, qc.token)
 
         return dto.Status(result.unwrap_or(default=False))
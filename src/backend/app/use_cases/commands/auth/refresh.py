@@ -5,7 +5,6 @@ from backend.app.bus.interfaces.handler import Handler
 from backend.app.contracts import exceptions as exc
 from backend.app.contracts.auth import (
     Context,
-    Fingerprint,
     JwtToken,
     RefreshStore,
     TokenPair,
@@ -24,6 +23,6 @@ class RefreshUserCommandHandler(Handler[Context, RefreshUserCommand, TokenPair])
 
     @override
     async def __call__(self, ctx: Context, qc: RefreshUserCommand, /) -> TokenPair:
-        result = await self.refresh_store.rotate(Fingerprint(qc.data.fingerprint), qc.token)
+        result = await self.refresh_store.rotate(qc.data.fingerprint, qc.token)
 
         return result.unwrap_or_raise(exc.UnAuthorizedError("Token is invalid or expired"))
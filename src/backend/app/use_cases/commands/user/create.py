@@ -21,8 +21,9 @@ class CreateUserCommandHandler(Handler[Context, CreateUserCommand, dto.Id[uuid.U
 
     @override
     async def __call__(self, ctx: Context, qc: CreateUserCommand, /) -> dto.Id[uuid.UUID]:
+        qc.data.password = (await self.hasher.hash_password(qc.data.password)).unwrap()
+
         async with await self.gateway.manager.with_transaction():
-            qc.data.password = self.hasher.hash_password(qc.data.password).unwrap()
             result = await self.gateway.user.create(qc.data)
 
         return dto.Id(
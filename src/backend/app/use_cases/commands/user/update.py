@@ -21,10 +21,10 @@ class UpdateUserCommandHandler(Handler[Context, UpdateUserCommand, dto.Status]):
 
     @override
     async def __call__(self, ctx: Context, qc: UpdateUserCommand, /) -> dto.Status:
-        async with await self.gateway.manager.with_transaction():
-            if qc.data.password is not None:
-                qc.data.password = self.hasher.hash_password(qc.data.password).unwrap()
+        if qc.data.password is not None:
+            qc.data.password = (await self.hasher.hash_password(qc.data.password)).unwrap()
 
+        async with await self.gateway.manager.with_transaction():
             result = await self.gateway.user.update(qc.data, **qc.filters)
 
             result.map_err(exc.ConflictError.from_other).unwrap()
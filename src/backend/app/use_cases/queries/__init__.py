@@ -1,4 +1,4 @@
-from typing import Any, Protocol, overload, runtime_checkable
+from typing import Any, Protocol, overload
 
 from backend.app.bus.interfaces.bus import AwaitableProxy
 from backend.app.bus.interfaces.handler import Handler
@@ -11,7 +11,6 @@ from . import rbac, user
 __all__ = ("rbac", "user")
 
 
-@runtime_checkable
 class QueryBus(Protocol):
     # rbac
     @overload
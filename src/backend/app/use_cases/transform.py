@@ -4,4 +4,4 @@ from typing import dataclass_transform
 
 @dataclass_transform()
 def handler[T](cls: type[T]) -> type[T]:
-    return dataclass(slots=True, frozen=True)(cls)
+    return dataclass(slots=True)(cls)
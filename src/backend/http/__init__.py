@@ -58,15 +58,13 @@ def _on_app_init(config: BackendConfig, *routers: Router) -> Callable[[AppConfig
         if config.api.metrics:
             from litestar.contrib.prometheus import PrometheusConfig, PrometheusController
 
+            metrics_name = (
+                "_".join(config.api.title.split()).replace("-", "_")
+                if config.api.title
+                else "Example"
+            )
             app_config.middleware.append(
-                PrometheusConfig(
-                    app_name="_".join(config.api.title.split()).replace("-", "_")
-                    if config.api.title
-                    else "Example",
-                    prefix="_".join(config.api.title.split()).replace("-", "_")
-                    if config.api.title
-                    else "Example",
-                ).middleware,
+                PrometheusConfig(app_name=metrics_name, prefix=metrics_name).middleware,
             )
             PrometheusController.get.include_in_schema = False
 
@@ -37,8 +37,8 @@ class BaseDoc:
                         summary=message or cls.message,
                         value={"message": message or cls.message},
                     ),
-                ]
-                + (examples or []),
+                    *(examples or ()),
+                ],
             ),
         }
 
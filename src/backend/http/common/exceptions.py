@@ -1,6 +1,5 @@
 import logging
 from collections.abc import Callable
-from functools import partial
 from typing import Any
 
 from litestar import MediaType, Request, Response, Router
@@ -39,19 +38,10 @@ def setup_exc_handlers(router: Router) -> None:
 def error_handler(
     status_code: int,
 ) -> Callable[..., JsonResponse]:
-    return partial(app_error_handler, status_code=status_code)
+    def _handler(request: BasicRequest, exc: app_exc.AppError) -> JsonResponse:
+        return handle_error(request, exc, status_code)
 
-
-def app_error_handler(
-    request: BasicRequest,
-    exc: app_exc.AppError,
-    status_code: int,
-) -> JsonResponse:
-    return handle_error(
-        request,
-        exc=exc,
-        status_code=status_code,
-    )
+    return _handler
 
 
 def handle_error(
@@ -59,7 +49,9 @@ def handle_error(
     exc: app_exc.AppError,
     status_code: int,
 ) -> JsonResponse:
-    log.error("Handle error: %s -> %s", type(exc).__name__, exc.args)
+    level = logging.ERROR if status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR else logging.INFO
+    if log.isEnabledFor(level):
+        log.log(level, "Handle error: %s -> %s", type(exc).__name__, exc.args)
 
     return JsonResponse(
         **exc.as_dict(),
@@ -1,20 +1,17 @@
 from litestar import Router
 from litestar.types.composite_types import Middleware
 
-from .context import ContextMiddleware
-from .process_time import ProcessTimeMiddleware
-from .x_request_id import XRequestIdMiddleware
+from .request_context import RequestContextMiddleware
 
 
 __all__ = (
-    "ProcessTimeMiddleware",
-    "XRequestIdMiddleware",
+    "RequestContextMiddleware",
     "setup_middlewares",
 )
 
 
 def middlewares() -> tuple[Middleware, ...]:
-    return (ProcessTimeMiddleware(), XRequestIdMiddleware(), ContextMiddleware())
+    return (RequestContextMiddleware(),)
 
 
 def setup_middlewares(app: Router) -> None:
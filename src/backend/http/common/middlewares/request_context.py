@@ -0,0 +1,49 @@
+import time
+from typing import Final
+
+from litestar import Request, types
+from litestar.constants import HTTP_RESPONSE_START
+from litestar.datastructures import MutableScopeHeaders
+from litestar.enums import ScopeType
+from litestar.middleware.base import ASGIMiddleware
+
+from backend.http.common.tools.context import context_from_request
+
+from .x_request_id import REQUEST_ID_HEADER, request_id_from
+
+
+PROCESS_TIME_HEADER: Final[str] = "X-Process-Time"
+
+
+class RequestContextMiddleware(ASGIMiddleware):
+    """
+    Stores the request id and `Context` in `scope["state"]` and adds
+    the `X-Request-Id` and `X-Process-Time` response headers.
+    """
+
+    def __init__(self, scopes: tuple[ScopeType, ...] = (ScopeType.HTTP, ScopeType.ASGI)) -> None:
+        self.scopes = scopes
+
+    async def handle(
+        self,
+        scope: types.Scope,
+        receive: types.Receive,
+        send: types.Send,
+        next_app: types.ASGIApp,
+    ) -> None:
+        start_time = time.perf_counter()
+        request_id = request_id_from(scope)
+
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        state["ctx"] = await context_from_request(Request(scope, receive, send))
+
+        async def send_wrapper(message: types.Message) -> None:
+            if message["type"] == HTTP_RESPONSE_START:
+                headers = MutableScopeHeaders.from_message(message=message)
+                headers[REQUEST_ID_HEADER] = request_id
+                headers[PROCESS_TIME_HEADER] = f"{time.perf_counter() - start_time:.5f}"
+
+            await send(message)
+
+        await next_app(scope, receive, send_wrapper)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import operator
 from collections.abc import Mapping
 from dataclasses import dataclass
 from typing import (
     Any,
+    Final,
 )
 from urllib.parse import urlencode
 
@@ -15,6 +17,10 @@ from backend.app.contracts import exceptions as exc
 from backend.app.contracts.auth import Context
 
 
+BODYLESS_METHODS: Final[frozenset[str]] = frozenset({"GET", "HEAD", "OPTIONS"})
+_BY_KEY: Final = operator.itemgetter(0)
+
+
 @dataclass(slots=True, frozen=True)
 class HttpContext(Context):
     request_id: str
@@ -31,24 +37,29 @@ async def context_from_request(request: Request[Any, Any, State]) -> HttpContext
         raise exc.ServiceNotImplemented("ASGI connection is not an HTTP connection")
 
     return HttpContext(
-        request_id=request.headers.get("x-request-id", request.state["request_id"]),
+        request_id=request.state["request_id"],
         user=request.scope.get("user"),
         request_method=request.scope["method"],
         request_path=request.scope["path"],
         request_path_params=request.path_params,
-        request_query_params=dict(request.query_params),
-        request_json_params=(await request.json()) or {},
+        request_query_params=dict(request.query_params) if request.scope["query_string"] else {},
+        request_json_params=(
+            {} if request.scope["method"] in BODYLESS_METHODS else (await request.json()) or {}
+        ),
         request_url=str(request.url),
     )
 
 
-def _sort_by_key(value: tuple[str, Any]) -> str:
-    return value[0]
-
-
 def cache_request_key_builder(ctx: Context) -> str:
+    params = ctx.request_query_params
+    if not params:
+        query = ""
+    elif len(params) == 1:
+        query = urlencode(params, doseq=True)
+    else:
+        query = urlencode(sorted(params.items(), key=_BY_KEY), doseq=True)
+
     return (
-        f"{ctx.request_method or ''}{ctx.request_path or ''}"
-        f"{urlencode(sorted(ctx.request_query_params.items(), key=_sort_by_key), doseq=True)}"
+        f"{ctx.request_method or ''}{ctx.request_path or ''}{query}"
         f"{ctx.user.id if ctx.user else ''}"
     )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+import functools
 from collections.abc import Mapping
-from dataclasses import MISSING, asdict, dataclass, field, fields, is_dataclass, make_dataclass
+from dataclasses import MISSING, dataclass, field, fields, is_dataclass, make_dataclass
 from types import UnionType
 from typing import (
     TYPE_CHECKING,
@@ -19,12 +20,14 @@ from typing import (
 from litestar.params import Parameter
 
 from backend.app.common.tools import convert_to
+from backend.app.contracts.pagination import _field_names
 
 
 if TYPE_CHECKING:
     import _typeshed
 
 
+@functools.cache
 def get_keys_from_type(tp: Any) -> frozenset[str]:
     if is_dataclass(tp):
         return frozenset(f.name for f in fields(tp))
@@ -32,10 +35,6 @@ def get_keys_from_type(tp: Any) -> frozenset[str]:
     return frozenset(tp.__annotations__.keys())
 
 
-def _filter_none(values: list[tuple[str, Any]]) -> dict[str, Any]:
-    return {k: v for k, v in values if v is not None}
-
-
 class ToOwned[T: Mapping[str, Any] | _typeshed.DataclassInstance]:
     """
     Base mixin for auto-dataclass query wrappers.
@@ -53,13 +52,9 @@ class ToOwned[T: Mapping[str, Any] | _typeshed.DataclassInstance]:
             dataclass(**kw)(cls)
 
     def to_owned(self) -> T:
-        if not TYPE_CHECKING:
-            if not issubclass(self.owned, Mapping):
-                data = asdict(self)
-            else:
-                data = asdict(self, dict_factory=_filter_none)
-        else:
-            data: Mapping[str, Any] = {}
+        data = {name: getattr(self, name) for name in _field_names(type(self))}
+        if issubclass(self.owned, Mapping):
+            data = {k: v for k, v in data.items() if v is not None}
 
         return convert_to(self.owned, data, strict=False)
 
@@ -189,7 +184,7 @@ def make_filter_query[T: Mapping[str, Any] | _typeshed.DataclassInstance](
 
     The resulting class includes `.to_owned() -> T`:
         - If `T` is a `Mapping`, `None` values are **removed** from the resulting dict.
-        - If `T` is a dataclass, `asdict(...)` is used (no filtering unless `Mapping`).
+        - If `T` is a dataclass, every field is passed through as is (no filtering).
 
     ### Examples
 
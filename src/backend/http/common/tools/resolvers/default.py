@@ -8,8 +8,8 @@ from backend.app.contracts.auth import Context, Permission, Source
 
 
 SOURCES: Final[Mapping[Source, Callable[[Context], frozenset[str]]]] = {
-    Source.QUERY: lambda ctx: ctx.request_query_keys(),
-    Source.JSON: lambda ctx: ctx.request_json_keys(),
+    Source.QUERY: Context.request_query_keys,
+    Source.JSON: Context.request_json_keys,
 }
 
 
@@ -41,21 +41,15 @@ def raise_fields_not_allowed(
 
 
 def resolve_keys_allowed_denylist(p: Permission, ctx: Context) -> None:
-    if not p.deny_fields or all(
-        not denied or raise_fields_not_allowed(keys & denied, src, ctx)
-        for src, denied in p.deny_fields.items()
-        if (keys := SOURCES[src](ctx))
-    ):
-        return
+    for src, denied in p.deny_fields.items():
+        if denied and (keys := SOURCES[src](ctx)):
+            raise_fields_not_allowed(keys & denied, src, ctx)
 
 
 def resolve_keys_allowed_allowlist(p: Permission, ctx: Context) -> None:
-    if not p.allow_fields or all(
-        not allowed or raise_fields_not_allowed(keys - allowed, src, ctx)
-        for src, allowed in p.allow_fields.items()
-        if (keys := SOURCES[src](ctx))
-    ):
-        return
+    for src, allowed in p.allow_fields.items():
+        if allowed and (keys := SOURCES[src](ctx)):
+            raise_fields_not_allowed(keys - allowed, src, ctx)
 
 
 def resolve_keys_allowed_mixed(p: Permission, ctx: Context) -> None:
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from collections.abc import Awaitable, Callable
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from litestar import Litestar
 from litestar.handlers.base import BaseRouteHandler
@@ -10,23 +10,11 @@ from backend.app.contracts.auth import Context, Permission, PermissionSpec, Scop
 from backend.app.contracts.manager import TransactionManager
 
 
-async def _default_resolve_scope(
-    manager: TransactionManager | None,
-    ctx: Context,
-    scope: Scope,
-) -> None: ...
-
-
-def _allow_all(p: Permission, ctx: Context) -> None: ...
-
-
 @dataclass(slots=True, frozen=True)
 class RouteRule:
     permission: PermissionSpec
-    check_fields: Callable[[Permission, Context], None] = field(default=_allow_all)
-    check_scope: Callable[[TransactionManager, Context, Scope], Awaitable[None]] = field(
-        default=_default_resolve_scope,
-    )
+    check_fields: Callable[[Permission, Context], None] | None = None
+    check_scope: Callable[[TransactionManager, Context, Scope], Awaitable[None]] | None = None
 
 
 def add_rule(rule: RouteRule) -> Callable[[BaseRouteHandler], BaseRouteHandler]:
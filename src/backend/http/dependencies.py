@@ -1,12 +1,18 @@
+import asyncio
+import dataclasses
 from collections.abc import Awaitable, Callable
-from dataclasses import asdict
+from typing import Any, Final
 
 from litestar import Litestar
 from litestar.config.app import AppConfig
 from litestar.di import Provide
 
 from backend.app.bus.core import QCBus
-from backend.app.bus.middlewares.cache import CacheInvalidateMiddleware, CacheMiddleware
+from backend.app.bus.middlewares.cache import (
+    CacheEpoch,
+    CacheInvalidateMiddleware,
+    CacheMiddleware,
+)
 from backend.app.common.tools import (
     ClosableProxy,
     lazy_single,
@@ -14,7 +20,7 @@ from backend.app.common.tools import (
     msgspec_encoder,
     singleton,
 )
-from backend.app.contracts.auth import Authenticator, JwtVerifier
+from backend.app.contracts.auth import Authenticator, JwtVerifier, PermissionSpec
 from backend.app.contracts.cache import StrCache
 from backend.app.contracts.manager import TransactionManager
 from backend.app.contracts.shared_lock import SharedLock
@@ -35,45 +41,61 @@ from backend.shared.di import DependencyContainer, FromScope, inject
 from config.core import BackendConfig
 
 
+RULES_KEY: Final[str] = "create_rules"
+RULES_DONE: Final[str] = "done"
+
+
+def _permission_values(spec: PermissionSpec) -> dict[str, Any]:
+    return {f.name: getattr(spec, f.name) for f in dataclasses.fields(spec) if f.name != "fields"}
+
+
 def create_rules(rules: list[RouteRule]) -> Callable[[Litestar], Awaitable[None]]:
     @inject
-    async def _inner(
-        _: Litestar, lock: type[SharedLock] = FromScope(SharedLock), cache: StrCache = FromScope()
-    ) -> None:
+    async def _inner(_: Litestar, cache: StrCache = FromScope()) -> None:
         @inject
         async def _create(manager: TransactionManager = FromScope()) -> None:
             await manager.with_transaction()
 
-            for rule in rules:
-                permission = await manager.send(
-                    queries.base.CreateOrIgnore[entity.Permission](
-                        **{
-                            k: v for k, v in asdict(rule.permission).items() if k not in ("fields",)
-                        },
-                    ),
-                )
-                if not permission:
-                    permission = await manager.send(
-                        queries.base.GetOne[entity.Permission](key=rule.permission.key()),
-                    )
-                    assert permission, "Permission not found"
-
-                fields = [
-                    {"permission_id": permission.id, "src": src, "name": name}
-                    for src, names in rule.permission.fields.items()
-                    for name in names
-                ]
-
-                if not fields:
-                    continue
+            specs = {rule.permission.key(): rule.permission for rule in rules}
+            if not specs:
+                return
+
+            await manager.send(
+                queries.base.BatchCreate[entity.Permission](
+                    data=[_permission_values(spec) for spec in specs.values()],
+                ),
+            )
+            permissions = await manager.send(
+                queries.base.GetAll[entity.Permission]().add_clauses(
+                    entity.Permission.key.in_(specs),
+                ),
+            )
+            ids = {permission.key: permission.id for permission in permissions}
+            assert not specs.keys() - ids.keys(), "Permission not found"
+
+            fields = [
+                {"permission_id": ids[rule.permission.key()], "src": src, "name": name}
+                for rule in rules
+                for src, names in rule.permission.fields.items()
+                for name in names
+            ]
+            if fields:
                 await manager.send(queries.base.BatchCreate[entity.PermissionField](data=fields))
 
-        async with lock("temp", timeout=20):
-            key = await cache.get("create_rules")
-            if key:
+        # workers that lose the claim wait for the done marker. If the seeding worker fails,
+        # it releases the marker and the next claim seeds again (inserts are idempotent)
+        while not await cache.set_nx(RULES_KEY, "1", expire=30):
+            if await cache.get(RULES_KEY) == RULES_DONE:
                 return
-            await cache.set("create_rules", "1", expire=30)
+            await asyncio.sleep(0.1)
+
+        try:
             await _create()
+        except BaseException:
+            await cache.delete(RULES_KEY)
+            raise
+
+        await cache.set(RULES_KEY, RULES_DONE, expire=30)
 
     return _inner
 
@@ -90,6 +112,7 @@ def setup_dependencies(app_config: AppConfig, backend_config: BackendConfig) ->
         max_overflow=m_conf.max_connections,
         pool_timeout=min(30, backend_config.db.connection_timeout),
         pool_pre_ping=backend_config.db.ping_connection,
+        pool_recycle=backend_config.db.recycle_seconds,
         json_serializer=msgspec_encoder,
         json_deserializer=msgspec_decoder,
         future=True,
@@ -100,6 +123,7 @@ def setup_dependencies(app_config: AppConfig, backend_config: BackendConfig) ->
         max_overflow=r_conf.max_connections,
         pool_timeout=min(30, backend_config.db.connection_timeout),
         pool_pre_ping=backend_config.db.ping_connection,
+        pool_recycle=backend_config.db.recycle_seconds,
         json_serializer=msgspec_encoder,
         json_deserializer=msgspec_decoder,
         future=True,
@@ -107,19 +131,26 @@ def setup_dependencies(app_config: AppConfig, backend_config: BackendConfig) ->
     jwt = JwtImpl.from_config(backend_config.security)
     cache = RedisCache.from_url(backend_config.redis.url)
     shared_lock = RedisSharedLock.create(cache._redis)  # noqa: SLF001
+    cache_epoch = CacheEpoch(cache)
     master_manager = ManagerFactory(m_conn)
     slave_manager = ManagerFactory(r_conn)
 
     query_lazy_gw = lazy_single(RepositoryGatewayImpl, slave_manager.make_transaction_manager)
-    refresh_store = RefreshStoreImpl(cache, jwt, shared_lock)
+    refresh_store = RefreshStoreImpl(cache, jwt)
     hasher = Argon2.default()
-    authenticator = AuthenticatorImpl(hasher)
+    authenticator = AuthenticatorImpl(hasher, cache=cache, epoch=cache_epoch.get)
     command_lazy_gw = lazy_single(RepositoryGatewayImpl, master_manager.make_transaction_manager)
     query_bus = (
         QCBus.builder()
         .dependencies(gateway=query_lazy_gw, lock=singleton(shared_lock))
         .bus(QueryBus)
-        .middleware(CacheMiddleware(cache=cache, cache_key_builder=cache_request_key_builder))
+        .middleware(
+            CacheMiddleware(
+                cache=cache,
+                cache_key_builder=cache_request_key_builder,
+                epoch=cache_epoch,
+            )
+        )
         .build()
     )
     command_bus = (
@@ -135,7 +166,7 @@ def setup_dependencies(app_config: AppConfig, backend_config: BackendConfig) ->
             hasher=hasher,
         )
         .bus(CommandBus)
-        .middleware(CacheInvalidateMiddleware(cache=cache))
+        .middleware(CacheInvalidateMiddleware(epoch=cache_epoch))
         .build()
     )
     app_config.dependencies["query_bus"] = Provide(
@@ -164,4 +195,5 @@ def setup_dependencies(app_config: AppConfig, backend_config: BackendConfig) ->
     app_config.state.master_pool = ClosableProxy(m_conn.engine, m_conn.engine.dispose)
     app_config.state.slave_pool = ClosableProxy(r_conn.engine, r_conn.engine.dispose)
     app_config.state.cache = ClosableProxy(cache, cache.close)
+    app_config.state.hasher = ClosableProxy(hasher, hasher.close)
     app_config.state.dep = ClosableProxy(container, container.reset)
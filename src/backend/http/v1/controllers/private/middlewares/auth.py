@@ -1,7 +1,6 @@
 import uuid
+from typing import Final
 
-from litestar import Request
-from litestar.datastructures.state import State
 from litestar.enums import ScopeType
 from litestar.middleware.base import ASGIMiddleware
 from litestar.types import ASGIApp, Receive, Scope, Send
@@ -14,6 +13,17 @@ from backend.http.common.tools.route_rule import RouteRule
 from backend.shared.di import FromScope, inject
 
 
+BEARER_PREFIX: Final[bytes] = b"bearer "
+
+
+def _get_raw_header(scope: Scope, name: bytes) -> bytes | None:
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+
+    return None
+
+
 class JWTAuthMiddleware(ASGIMiddleware):
     def __init__(
         self,
@@ -25,34 +35,34 @@ class JWTAuthMiddleware(ASGIMiddleware):
         self.exclude_opt_key = exclude_from_auth_key
         self.exclude_path_pattern = exclude
         self.auth_header = auth_header
+        self._auth_header_bytes = auth_header.lower().encode("latin-1")
 
         if scopes:
             self.scopes = scopes
 
     async def handle(self, scope: Scope, receive: Receive, send: Send, next_app: ASGIApp) -> None:
-        await self.authenticate_request(Request(scope, receive, send))
+        await self.authenticate_request(scope)
 
         await next_app(scope, receive, send)
 
-    async def authenticate_request(
-        self,
-        request: Request[None, None, State],
-    ) -> None:
-        auth_header = request.headers.get(self.auth_header)
+    async def authenticate_request(self, scope: Scope) -> None:
+        auth_header = _get_raw_header(scope, self._auth_header_bytes)
         if not auth_header:
             raise exc.UnAuthorizedError("Token is missing")
 
-        scheme, _, encoded_token = auth_header.partition(" ")
-        if scheme.lower() != "bearer":
+        if auth_header[: len(BEARER_PREFIX)].lower() != BEARER_PREFIX:
             raise exc.UnAuthorizedError("Invalid token provided")
 
-        await self.authenticate_token(encoded_token, request=request)
+        await self.authenticate_token(
+            auth_header[len(BEARER_PREFIX) :].decode("latin-1"),
+            scope=scope,
+        )
 
     @inject
     async def authenticate_token(
         self,
         encoded_token: str,
-        request: Request[None, None, State],
+        scope: Scope,
         jwt: JwtVerifier = FromScope(),
         manager: TransactionManager = FromScope(),
         authenticator: Authenticator = FromScope(),
@@ -63,12 +73,12 @@ class JWTAuthMiddleware(ASGIMiddleware):
             .unwrap_or_raise(exc.UnAuthorizedError("Token is invalid or expired"))
         )
 
-        request.scope["auth"] = claims
+        scope["auth"] = claims
 
         user = await self.authenticate_user(
-            sub=claims.sub, request=request, manager=manager, authenticator=authenticator
+            sub=claims.sub, scope=scope, manager=manager, authenticator=authenticator
         )
-        ctx = request.state.ctx
+        ctx: Context = scope["state"]["ctx"]
         ctx.update_user(user)
 
         if not user.roles:
@@ -77,7 +87,7 @@ class JWTAuthMiddleware(ASGIMiddleware):
         if user.is_superuser:
             return
 
-        rule: RouteRule | None = getattr(request.scope["route_handler"].fn, "rule", None)
+        rule: RouteRule | None = getattr(scope["route_handler"].fn, "rule", None)
         if not rule:
             return
 
@@ -97,20 +107,22 @@ class JWTAuthMiddleware(ASGIMiddleware):
 
         permission = p.unwrap()
 
-        await rule.check_scope(manager, ctx, permission.scope)
-        rule.check_fields(permission, ctx)
+        if rule.check_scope is not None:
+            await rule.check_scope(manager, ctx, permission.scope)
+        if rule.check_fields is not None:
+            rule.check_fields(permission, ctx)
 
     async def authenticate_user(
         self,
         sub: str,
-        request: Request[None, None, State],
+        scope: Scope,
         manager: TransactionManager,
         authenticator: Authenticator,
     ) -> AuthUser:
-        user = (await authenticator.authenticate(manager, user_id=uuid.UUID(sub))).unwrap_or_raise(
+        user = (await authenticator.get_user_by_id(manager, uuid.UUID(sub))).unwrap_or_raise(
             exc.UnAuthorizedError("Unauthorized")
         )
 
-        request.scope["user"] = user
+        scope["user"] = user
 
         return user
@@ -2,6 +2,7 @@ from datetime import timedelta
 from typing import Self
 
 import redis.asyncio as aioredis
+from redis.asyncio.client import Pipeline
 
 from backend.app.contracts.cache import StrCache
 
@@ -31,11 +32,26 @@ class RedisCache(StrCache):
     async def set(
         self,
         key: str,
-        value: str,
+        value: str | bytes,
         expire: float | timedelta | None = None,
     ) -> None:
         await self._redis.set(key, value, ex=expire)
 
+    async def set_nx(
+        self,
+        key: str,
+        value: str,
+        expire: float | timedelta | None = None,
+    ) -> bool:
+        return bool(
+            await self._redis.set(
+                key,
+                value,
+                ex=timedelta(seconds=expire) if isinstance(expire, float | int) else expire,
+                nx=True,
+            )
+        )
+
     async def delete(self, *keys: str) -> None:
         if any("*" in key for key in keys) and (
             found_keys := [found for key in keys async for found in self._redis.scan_iter(key)]
@@ -65,6 +81,12 @@ class RedisCache(StrCache):
     ) -> list[str]:
         return [_ensure_string(v) for v in await self._redis.lrange(key, 0, -1)]
 
+    async def get_sorted(
+        self,
+        key: str,
+    ) -> list[str]:
+        return [_ensure_string(v) for v in await self._redis.zrange(key, 0, -1)]
+
     async def discard(
         self,
         key: str,
@@ -87,5 +109,8 @@ class RedisCache(StrCache):
     async def decrement(self, key: str, amount: int = 1) -> int:
         return await self._redis.decrby(key, amount)
 
+    def pipeline(self, *, transaction: bool = True) -> Pipeline:
+        return self._redis.pipeline(transaction=transaction)
+
     async def close(self) -> None:
         await self._redis.aclose(close_connection_pool=True)  # type: ignore[attr-defined]
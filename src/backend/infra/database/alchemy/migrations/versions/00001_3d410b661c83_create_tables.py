@@ -19,8 +19,13 @@ branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
 
+def _read_sql(*path: str) -> str:
+    with open(absolute_path("src", "backend", "infra", "database", "alchemy", "sql", *path), mode="r") as f:
+        return f.read()
+
+
 def upgrade() -> None:
-    op.execute(open(absolute_path("src", "backend", "infra", "database", "alchemy", "sql", "functions", "uuid_generate_v7.sql"), mode="r").read())
+    op.execute(_read_sql("functions", "uuid_generate_v7.sql"))
     op.execute("CREATE EXTENSION IF NOT EXISTS pgcrypto;")
     op.execute('CREATE EXTENSION IF NOT EXISTS "uuid-ossp";')
     op.execute('CREATE EXTENSION IF NOT EXISTS pg_cron;')
@@ -96,9 +101,9 @@ def upgrade() -> None:
     op.create_index(op.f('ix_role_permission_field_field_id'), 'role_permission_field', ['field_id'], unique=False)
     op.create_index(op.f('ix_role_permission_field_permission_id'), 'role_permission_field', ['permission_id'], unique=False)
     # ### end Alembic commands ###
-    for stmt in open(absolute_path("src", "backend", "infra", "database", "alchemy", "sql", "mv", "user_permissions.sql"), mode="r").read().split("-- next --"):
+    for stmt in _read_sql("mv", "user_permissions.sql").split("-- next --"):
         op.execute(stmt.strip())
-    for stmt in open(absolute_path("src", "backend", "infra", "database", "alchemy", "sql", "triggers", "refresh_user_permissions.sql"), mode="r").read().split("-- next --"):
+    for stmt in _read_sql("triggers", "refresh_user_permissions.sql").split("-- next --"):
         op.execute(stmt.strip())
 
 def downgrade() -> None:
@@ -16,7 +16,7 @@ except ImportError as e:
     ) from e
 
 
-@dataclass
+@dataclass(slots=True)
 class NatsBaseEventHandler(EventHandler[Event]):
     client: Client
     encoder: JsonDumps
@@ -31,7 +31,7 @@ class NatsBaseEventHandler(EventHandler[Event]):
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class NatsJsEventHandler(EventHandler[Event]):
     js: JetStreamContext
     encoder: JsonDumps
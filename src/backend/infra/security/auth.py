@@ -1,6 +1,10 @@
 import uuid
+from collections.abc import Awaitable, Callable
+from dataclasses import replace
 
+from backend.app.common.tools import json_decoder_for, msgspec_encoder
 from backend.app.contracts.auth import AuthUser, Permission, PermissionSpec, Role
+from backend.app.contracts.cache import StrCache
 from backend.app.contracts.manager import TransactionManager
 from backend.infra.database.alchemy import entity, queries
 from backend.infra.shared.result import as_result
@@ -9,10 +13,24 @@ from .hasher import Argon2
 
 
 class AuthenticatorImpl:
-    __slots__ = ("_hasher",)
+    __slots__ = (
+        "_cache",
+        "_cache_time",
+        "_epoch",
+        "_hasher",
+    )
 
-    def __init__(self, hasher: Argon2) -> None:
+    def __init__(
+        self,
+        hasher: Argon2,
+        cache: StrCache,
+        epoch: Callable[[], Awaitable[int]],
+        cache_time: float = 60,
+    ) -> None:
         self._hasher = hasher
+        self._cache = cache
+        self._epoch = epoch
+        self._cache_time = cache_time
 
     @as_result()
     async def authenticate(
@@ -24,6 +42,32 @@ class AuthenticatorImpl:
     ) -> AuthUser | None:
         assert email or user_id, "Either `email` or `user_id` must be provided"
 
+        return await self._load_user(manager, email=email, user_id=user_id)
+
+    @as_result()
+    async def get_user_by_id(
+        self, manager: TransactionManager, user_id: uuid.UUID
+    ) -> AuthUser | None:
+        key = await self._get_cache_key(f"user:{user_id.hex}")
+        if cached := await self._cache.get(key):
+            return json_decoder_for(AuthUser).decode(cached)
+
+        user = await self._load_user(manager, user_id=user_id)
+        if user is None:
+            return None
+
+        user = replace(user, password=None)
+        await self._cache.set(key, msgspec_encoder(user), expire=self._cache_time)
+
+        return user
+
+    async def _load_user(
+        self,
+        manager: TransactionManager,
+        *,
+        email: str | None = None,
+        user_id: uuid.UUID | None = None,
+    ) -> AuthUser | None:
         user = await manager.send(
             queries.base.GetOne[entity.User]("roles", email=email, id=user_id)
         )
@@ -44,6 +88,17 @@ class AuthenticatorImpl:
     async def get_permission_for(
         self, user: AuthUser, permission: PermissionSpec, manager: TransactionManager
     ) -> Permission | None:
-        return await manager.send(
+        key = await self._get_cache_key(f"permission:{user.id.hex}:{permission.key()}")
+        if cached := await self._cache.get(key):
+            return json_decoder_for(Permission).decode(cached)
+
+        result = await manager.send(
             queries.user.GetUserPermission(user_id=user.id, permission_key=permission.key())
         )
+        if result is not None:
+            await self._cache.set(key, msgspec_encoder(result), expire=self._cache_time)
+
+        return result
+
+    async def _get_cache_key(self, key: str) -> str:
+        return f"{await self._epoch()}:auth:{key}"
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import asyncio
+import os
 from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from typing import Final, Literal
 
 from argon2 import Parameters, PasswordHasher
@@ -15,9 +19,19 @@ from argon2.profiles import (
 from backend.infra.shared.result import as_result
 
 
-ProfileType = Literal["RFC_9106_LOW_MEMORY", "RFC_9106_HIGH_MEMORY", "CHEAPEST", "PRE_21_2"]
+ProfileType = Literal[
+    "OWASP",
+    "RFC_9106_LOW_MEMORY",
+    "RFC_9106_HIGH_MEMORY",
+    "CHEAPEST",
+    "PRE_21_2",
+]
+
+# OWASP password storage cheat sheet: argon2id, m=12 MiB, t=3, p=1
+OWASP: Final[Parameters] = replace(RFC_9106_LOW_MEMORY, memory_cost=12_288, parallelism=1)
 
 PROFILES: Final[Mapping[str, Parameters]] = {
+    "OWASP": OWASP,
     "RFC_9106_LOW_MEMORY": RFC_9106_LOW_MEMORY,
     "RFC_9106_HIGH_MEMORY": RFC_9106_HIGH_MEMORY,
     "CHEAPEST": CHEAPEST,
@@ -26,30 +40,57 @@ PROFILES: Final[Mapping[str, Parameters]] = {
 
 
 class Argon2:
-    __slots__ = ("_hasher",)
+    __slots__ = (
+        "_executor",
+        "_hasher",
+    )
 
-    def __init__(self, hasher: PasswordHasher) -> None:
+    def __init__(self, hasher: PasswordHasher, executor: ThreadPoolExecutor) -> None:
         self._hasher = hasher
+        self._executor = executor
 
     @classmethod
     def default(cls) -> Argon2:
-        return cls(PasswordHasher())
+        return cls.from_parameters(OWASP)
 
     @classmethod
     def from_profile(cls, profile: ProfileType) -> Argon2:
         return cls.from_parameters(PROFILES[profile])
 
     @classmethod
-    def from_parameters(cls, parameters: Parameters) -> Argon2:
-        return cls(PasswordHasher.from_parameters(parameters))
+    def from_parameters(cls, parameters: Parameters, max_workers: int | None = None) -> Argon2:
+        # every running hash holds `memory_cost` KiB (12 MiB for OWASP) and one core (p=1),
+        # so the pool caps memory at max_workers * memory_cost
+        return cls(
+            PasswordHasher.from_parameters(parameters),
+            ThreadPoolExecutor(
+                max_workers=max_workers or os.cpu_count() or 1,
+                thread_name_prefix="argon2",
+            ),
+        )
+
+    @as_result()
+    async def hash_password(self, plain: str) -> str:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            self._hasher.hash,
+            plain,
+        )
 
-    @as_result(is_async=False)
-    def hash_password(self, plain: str) -> str:
-        return self._hasher.hash(plain)
+    @as_result()
+    async def verify_password(self, hashed: str, plain: str) -> bool:
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor,
+            self._verify,
+            hashed,
+            plain,
+        )
 
-    @as_result(is_async=False)
-    def verify_password(self, hashed: str, plain: str) -> bool:
+    def _verify(self, hashed: str, plain: str) -> bool:
         try:
             return self._hasher.verify(hashed, plain)
         except (VerificationError, VerifyMismatchError):
             return False
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
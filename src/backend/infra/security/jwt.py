@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import base64
 import hashlib
+import random
+import time
 import uuid
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import jwt
+from redis.asyncio.client import Pipeline
 from uuid_utils import uuid4
 
 from backend.app.contracts.auth import (
@@ -17,7 +20,6 @@ from backend.app.contracts.auth import (
     TokenPair,
     TokenType,
 )
-from backend.app.contracts.shared_lock import SharedLock
 from backend.infra.cache.redis import RedisCache
 from backend.infra.shared.result import as_result
 from config.core import SecurityConfig
@@ -37,6 +39,7 @@ class JwtImpl:
         "_algorithm",
         "_public_key",
         "_refresh_expires",
+        "_refresh_jitter",
         "_secret_key",
     )
 
@@ -47,12 +50,14 @@ class JwtImpl:
         secret_key: str,
         access_expires: float,
         refresh_expires: float,
+        refresh_jitter: float = 0.0,
     ) -> None:
         self._algorithm = algorithm
         self._public_key = _try_decode(public_key)
         self._secret_key = _try_decode(secret_key)
         self._access_expires = access_expires
         self._refresh_expires = refresh_expires
+        self._refresh_jitter = refresh_jitter
 
     @classmethod
     def from_config(cls, config: SecurityConfig) -> JwtImpl:
@@ -62,6 +67,7 @@ class JwtImpl:
             secret_key=config.secret_key,
             access_expires=config.access_token_expire_seconds,
             refresh_expires=config.refresh_token_expire_seconds,
+            refresh_jitter=config.refresh_token_expire_jitter,
         )
 
     def _encode(
@@ -118,7 +124,7 @@ class JwtImpl:
                 timedelta(seconds=refresh_ttl) if isinstance(refresh_ttl, int) else refresh_ttl
             )
         else:
-            refresh_ttl = timedelta(seconds=self._refresh_expires)
+            refresh_ttl = timedelta(seconds=self._jittered_refresh_expires())
 
         now = datetime.now(UTC)
 
@@ -131,6 +137,14 @@ class JwtImpl:
             int(refresh_ttl.total_seconds()),
         )
 
+    def _jittered_refresh_expires(self) -> float:
+        if not self._refresh_jitter:
+            return self._refresh_expires
+
+        return self._refresh_expires * (
+            1 + random.uniform(-self._refresh_jitter, self._refresh_jitter)  # noqa: S311
+        )
+
     @as_result(is_async=False)
     def verify(self, token: str, iss: str | None = None, aud: str | None = None) -> TokenClaims:
         return TokenClaims(
@@ -141,79 +155,109 @@ class JwtImpl:
 
 
 class RefreshStoreImpl:
+    """
+    One `auth:{user_id}:{jti}` key per refresh session, holding the hashed token.
+    `auth:{user_id}` is a sorted set of the user's jtis scored by expiry, so reuse
+    of a rotated token can revoke every session; expired jtis are trimmed on write.
+    """
+
     __slots__ = (
         "_cache",
         "_jwt",
-        "_lock",
     )
 
-    def __init__(self, cache: RedisCache, jwt: JwtImpl, lock: type[SharedLock]) -> None:
+    def __init__(self, cache: RedisCache, jwt: JwtImpl) -> None:
         self._cache = cache
         self._jwt = jwt
-        self._lock = lock
 
     @as_result()
     async def make_token(self, user_id: uuid.UUID, fingerprint: Fingerprint) -> TokenPair:
-        key = AUTH_KEY_PREFIX.format(user_id=user_id.hex)
         jti = uuid4().hex
 
         pair = self._jwt.issue_pair(user_id.hex, jti=jti).unwrap()
-        hashed_pair = (
-            f"{jti}:{hashlib.sha256(f'{fingerprint}:{pair.refresh_token}'.encode()).hexdigest()}"
-        )
 
-        await self._cache.set_list(key, hashed_pair)
+        async with self._cache.pipeline() as pipe:
+            self._add_session(pipe, user_id.hex, jti, fingerprint, pair)
+            await pipe.execute()
 
         return pair
 
     @as_result()
     async def rotate(self, fingerprint: Fingerprint, token: JwtToken) -> TokenPair | None:
-        claims = self._get_verified_claims(token)
+        user_id, old_jti = self._get_verified_session(token)
 
-        key = AUTH_KEY_PREFIX.format(user_id=claims.sub)
+        jti = uuid4().hex
+        result = self._jwt.issue_pair(user_id, jti=jti).unwrap()
 
-        async with self._lock(f"lock:{key}", timeout=15):
-            hashed_pair = self._get_hashed_pair(claims, fingerprint, token)
+        async with self._cache.pipeline() as pipe:
+            pipe.getdel(self._get_session_key(user_id, old_jti))
+            pipe.zrem(self._get_index_key(user_id), old_jti)
+            self._add_session(pipe, user_id, jti, fingerprint, result)
+            stored, *_ = await pipe.execute()
 
-            if not any(pair == hashed_pair for pair in await self._cache.get_list(key)):
-                await self._cache.delete(key)
-                return None
+        if stored != self._get_hashed_token(fingerprint, token):
+            # unknown or already rotated token: drop every session, the new one included
+            await self._revoke_all(user_id)
+            return None
 
-            await self._cache.discard(key, hashed_pair)
+        return result
 
-            result = self._jwt.issue_pair(claims.sub, jti=claims.jti or uuid4().hex).unwrap()
+    @as_result()
+    async def revoke(self, fingerprint: Fingerprint, token: JwtToken) -> bool:
+        user_id, jti = self._get_verified_session(token)
 
-            await self._cache.set_list(
-                key,
-                self._get_hashed_pair(claims, fingerprint, result.refresh_token),
-                expire=result.expires_in,
-            )
+        key = self._get_session_key(user_id, jti)
 
-            return result
+        if await self._cache.get(key) != self._get_hashed_token(fingerprint, token):
+            return False
 
-    @as_result()
-    async def revoke(self, fingerprint: Fingerprint, token: JwtToken) -> bool:
-        claims = self._get_verified_claims(token)
+        async with self._cache.pipeline() as pipe:
+            pipe.delete(key)
+            pipe.zrem(self._get_index_key(user_id), jti)
+            await pipe.execute()
 
-        key = AUTH_KEY_PREFIX.format(user_id=claims.sub)
-        hashed_pair = self._get_hashed_pair(claims, fingerprint, token)
+        return True
 
-        if any(pair == hashed_pair for pair in await self._cache.get_list(key)):
-            await self._cache.discard(key, hashed_pair)
-            return True
+    def _add_session(
+        self,
+        pipe: Pipeline,
+        user_id: str,
+        jti: str,
+        fingerprint: Fingerprint,
+        pair: TokenPair,
+    ) -> None:
+        now = int(time.time())
+        index_key = self._get_index_key(user_id)
 
-        return False
+        pipe.set(
+            self._get_session_key(user_id, jti),
+            self._get_hashed_token(fingerprint, pair.refresh_token),
+            ex=pair.expires_in,
+        )
+        pipe.zadd(index_key, {jti: now + pair.expires_in})
+        pipe.zremrangebyscore(index_key, "-inf", now)
+        # the index lives as long as its longest session
+        pipe.expire(index_key, pair.expires_in, nx=True)
+        pipe.expire(index_key, pair.expires_in, gt=True)
 
-    def _get_verified_claims(self, token: JwtToken) -> TokenClaims:
+    async def _revoke_all(self, user_id: str) -> None:
+        index_key = self._get_index_key(user_id)
+        jtis = await self._cache.get_sorted(index_key)
+
+        await self._cache.delete(index_key, *(self._get_session_key(user_id, jti) for jti in jtis))
+
+    def _get_verified_session(self, token: JwtToken) -> tuple[str, str]:
         return (
             self._jwt.verify(token.token)
-            .and_then(lambda c: c if c.typ == "refresh" else None)
+            .and_then(lambda c: (c.sub, c.jti) if c.typ == "refresh" and c.jti else None)
             .unwrap()
         )
 
-    def _get_hashed_pair(
-        self, claims: TokenClaims, fingerprint: Fingerprint, token: JwtToken
-    ) -> str:
-        hashed_pair = hashlib.sha256(f"{fingerprint}:{token}".encode()).hexdigest()
+    def _get_index_key(self, user_id: str) -> str:
+        return AUTH_KEY_PREFIX.format(user_id=user_id)
+
+    def _get_session_key(self, user_id: str, jti: str) -> str:
+        return f"{self._get_index_key(user_id)}:{jti}"
 
-        return hashed_pair if not claims.jti else f"{claims.jti}:{hashed_pair}"
+    def _get_hashed_token(self, fingerprint: Fingerprint, token: JwtToken) -> str:
+        return hashlib.sha256(f"{fingerprint}:{token}".encode()).hexdigest()
@@ -1,7 +1,7 @@
 import socket
 from typing import Any
 
-from granian.constants import Interfaces
+from granian.constants import Interfaces, Loops
 from granian.server import Server as Granian
 
 from config.core import BackendConfig
@@ -20,6 +20,7 @@ def run_granian(
         "workers": workers,
         "log_access": config.server.log,
         "interface": Interfaces.ASGI,
+        "loop": Loops.uvloop,
         "log_access_format": (
             '[%(time)s] %(addr)s - "%(method)s %(path)s %(query_string)s '
             '%(protocol)s" %(status)d %(dt_ms).3f'
@@ -1,13 +1,19 @@
 # mypy: ignore-errors
 
-from typing import Any
+import socket
+from pathlib import Path
+from typing import Any, Final
 
 from gunicorn.app.base import Application
 from gunicorn.glogging import CONFIG_DEFAULTS
+from uvicorn.workers import UvicornWorker
 
 from config.core import BackendConfig
 
 
+SHM_DIR: Final[Path] = Path("/dev/shm")  # noqa: S108
+
+
 class GunicornApp(Application):
     def __init__(self, app: Any, options: dict[str, Any] | None = None, **kw: Any) -> None:
         self._options = options or {}
@@ -23,17 +29,37 @@ class GunicornApp(Application):
         return self._app
 
 
+def _make_worker_class(limit_concurrency: int | None) -> type[UvicornWorker]:
+    return type(
+        UvicornWorker.__name__,
+        (UvicornWorker,),
+        {
+            "CONFIG_KWARGS": {
+                **UvicornWorker.CONFIG_KWARGS,
+                "loop": "uvloop",
+                "limit_concurrency": limit_concurrency,
+            },
+        },
+    )
+
+
 def run_gunicorn(app: Any, config: BackendConfig, **kw: Any) -> None:
+    workers = max(1, config.server.workers_count())
+    limit_concurrency = max(100, config.compute_concurrency_limit(workers)) if workers > 1 else None
     options = {
         "bind": f"{config.server.host}:{config.server.port}",
-        "worker_class": "uvicorn.workers.UvicornWorker",
+        "worker_class": _make_worker_class(limit_concurrency),
         "preload_app": False,
-        "workers": config.server.workers_count(),
+        "workers": workers,
         "accesslog": "-" if config.server.log else None,
         "errorlog": "-" if config.server.log else None,
         "capture_output": True,
         "logconfig_dict": CONFIG_DEFAULTS,
         "reuse_port": True,
+        "backlog": max(2048, socket.SOMAXCONN),
+        "keepalive": config.server.keepalive,
+        "graceful_timeout": config.server.graceful_timeout,
+        "worker_tmp_dir": str(SHM_DIR) if SHM_DIR.is_dir() else None,
     }
     gunicorn_app = GunicornApp(app, options | kw)
 
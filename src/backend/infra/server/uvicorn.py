@@ -13,9 +13,12 @@ def run_uvicorn(app: Any, config: BackendConfig, **kw: Any) -> None:
         "workers": workers,
         "host": config.server.host,
         "port": config.server.port,
+        "loop": "uvloop",
         "access_log": config.server.log,
         "limit_concurrency": limit_concurrency,
         "backlog": max(2048, socket.SOMAXCONN),
+        "timeout_keep_alive": config.server.keepalive,
+        "timeout_graceful_shutdown": config.server.graceful_timeout,
     }
     uvicorn.run(
         app,
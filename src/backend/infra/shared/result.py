@@ -3,7 +3,7 @@ from __future__ import annotations
 import traceback
 from collections.abc import Callable, Coroutine
 from functools import wraps
-from typing import Any, Literal, NamedTuple, overload
+from typing import Any, Literal, NamedTuple, cast, overload
 
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -28,16 +28,16 @@ class ResultImpl[T, E: Exception](NamedTuple):
 
     def map_err[O: Exception](self, f: Callable[[E], O]) -> ResultImpl[T, O]:
         return (
-            ResultImpl[T, O](self.data, f(self.err))
+            ResultImpl(self.data, f(self.err))
             if self.err is not None
-            else ResultImpl[T, O](self.data, None)
+            else cast(ResultImpl[T, O], self)
         )
 
     def map[R](self, f: Callable[[T], R]) -> ResultImpl[R, E]:
         return (
-            ResultImpl[R, E](f(self.data), self.err)
+            ResultImpl(f(self.data), self.err)
             if self.data is not None
-            else ResultImpl[R, E](None, self.err)
+            else cast(ResultImpl[R, E], self)
         )
 
     def map_or[R](self, default: R, f: Callable[[T], R]) -> R:
@@ -53,9 +53,9 @@ class ResultImpl[T, E: Exception](NamedTuple):
 
     def and_then[R](self, f: Callable[[T], R | None]) -> ResultImpl[R, E]:
         return (
-            ResultImpl[R, E](f(self.data), self.err)
+            ResultImpl(f(self.data), self.err)
             if self.data is not None
-            else ResultImpl[R, E](None, self.err)
+            else cast(ResultImpl[R, E], self)
         )
 
     def unwrap_or(self, default: T) -> T:
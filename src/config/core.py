@@ -8,6 +8,7 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Literal
 from urllib.parse import quote
 
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -52,6 +53,7 @@ class DbConfig(BaseSettings):
     connection_timeout: int = 10
     min_connections: int = 10
     ping_connection: bool = True
+    recycle_seconds: int = -1
     max_connections: int = 100
     replica_max_connections: int = 100
 
@@ -80,6 +82,8 @@ class ServerConfig(BaseSettings):
     workers: int | Literal["auto"] = "auto"
     log: bool = True
     strategy: Strategy = "throughput"
+    keepalive: int = 5
+    graceful_timeout: int = 30
 
     def workers_count(self) -> int:
         if self.workers == "auto":
@@ -145,6 +149,7 @@ class SecurityConfig(BaseSettings):
     public_key: str = ""
     access_token_expire_seconds: int = 0
     refresh_token_expire_seconds: int = 0
+    refresh_token_expire_jitter: float = Field(default=0.0, ge=0, lt=1)
 
 
 @dataclass(slots=True, frozen=True)
@@ -24,3 +24,33 @@ async def test_logout_success(
         json={"fingerprint": "fp"},
     )
     assert logout.status_code == 200
+
+
+async def test_logout_wrong_fingerprint_keeps_session(
+    client: AsyncTestClient[Litestar]
+) -> None:
+    payload = {"email": "pub8@test.com", "password": "password_1"}
+    r1 = await client.post(f"/v1/public/users", json=payload)
+    assert r1.status_code == 201
+
+    login = await client.post(
+        f"/v1/public/auth/login",
+        json={"fingerprint": "fp", **payload},
+    )
+    assert login.status_code == 200
+    token = login.cookies.get("refresh") or ""
+
+    logout = await client.post(
+        f"/v1/public/auth/logout",
+        json={"fingerprint": "other"},
+        cookies={"refresh": token},
+    )
+    assert logout.status_code == 200
+    assert logout.json().get("status") is False
+
+    refresh = await client.post(
+        f"/v1/public/auth/refresh",
+        json={"fingerprint": "fp"},
+        cookies={"refresh": token},
+    )
+    assert refresh.status_code == 200
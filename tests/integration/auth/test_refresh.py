@@ -1,11 +1,35 @@
 from __future__ import annotations
 
+from datetime import UTC, datetime, timedelta
+
+import jwt
 from litestar import Litestar
 from litestar.testing import AsyncTestClient
 
+from config.core import BackendConfig
 from tests.integration.conftest import *  # noqa: F403
 
 
+async def _login(client: AsyncTestClient[Litestar], payload: dict[str, str]) -> str:
+    login = await client.post(
+        f"/v1/public/auth/login",
+        json={"fingerprint": "fp", **payload},
+    )
+    assert login.status_code == 200
+
+    return login.cookies.get("refresh") or ""
+
+
+async def _refresh(client: AsyncTestClient[Litestar], token: str) -> tuple[int, str]:
+    refresh = await client.post(
+        f"/v1/public/auth/refresh",
+        json={"fingerprint": "fp"},
+        cookies={"refresh": token},
+    )
+
+    return refresh.status_code, refresh.cookies.get("refresh") or ""
+
+
 async def test_refresh_success(
     client: AsyncTestClient[Litestar]
 ) -> None:
@@ -81,3 +105,53 @@ async def test_refresh_unauthorized(
         json={"fingerprint": "fp"},
     )
     assert refresh.status_code == 401
+
+
+async def test_refresh_reuse_revokes_all_sessions(
+    client: AsyncTestClient[Litestar]
+) -> None:
+    payload = {"email": "pub6@test.com", "password": "password_1"}
+    r1 = await client.post(f"/v1/public/users", json=payload)
+    assert r1.status_code == 201
+
+    first = await _login(client, payload)
+    second = await _login(client, payload)
+
+    status, rotated = await _refresh(client, first)
+    assert status == 200
+    assert rotated and rotated != first
+
+    status, _ = await _refresh(client, first)
+    assert status == 401
+
+    status, _ = await _refresh(client, rotated)
+    assert status == 401
+
+    status, _ = await _refresh(client, second)
+    assert status == 401
+
+
+async def test_refresh_without_jti_unauthorized(
+    client: AsyncTestClient[Litestar],
+    app_config: BackendConfig,
+) -> None:
+    payload = {"email": "pub7@test.com", "password": "password_1"}
+    r1 = await client.post(f"/v1/public/users", json=payload)
+    assert r1.status_code == 201
+
+    await _login(client, payload)
+
+    now = datetime.now(UTC)
+    token = jwt.encode(
+        {
+            "sub": r1.json()["id"],
+            "typ": "refresh",
+            "iat": now,
+            "exp": now + timedelta(minutes=5),
+        },
+        app_config.security.secret_key,
+        algorithm=app_config.security.algorithm,
+    )
+
+    status, _ = await _refresh(client, token)
+    assert status == 401
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import sqlalchemy as sa
+from litestar import Litestar
+from litestar.testing import AsyncTestClient
+
+from backend.app.contracts.cache import StrCache
+from backend.app.contracts.manager import TransactionManager
+from backend.http.common.tools.route_rule import collect_rules
+from backend.http.dependencies import RULES_DONE, RULES_KEY, create_rules
+from backend.infra.database.alchemy import entity
+from tests.integration.conftest import *  # noqa: F403
+
+
+async def _count_rows(manager: TransactionManager) -> tuple[int, int]:
+    permissions = await manager.conn.execute(sa.select(sa.func.count()).select_from(entity.Permission))
+    fields = await manager.conn.execute(sa.select(sa.func.count()).select_from(entity.PermissionField))
+
+    return permissions.scalar_one(), fields.scalar_one()
+
+
+async def test_create_rules_is_idempotent(
+    client: AsyncTestClient[Litestar], app: Litestar, manager: TransactionManager, cache: StrCache
+) -> None:
+    assert await cache.get(RULES_KEY) == RULES_DONE
+
+    seeded = await _count_rows(manager)
+    assert seeded[0] > 0
+
+    await cache.delete(RULES_KEY)
+    await create_rules(collect_rules(app))(app)
+
+    assert await cache.get(RULES_KEY) == RULES_DONE
+    assert await _count_rows(manager) == seeded
+
+
+async def test_create_rules_waits_for_seeding_worker(
+    client: AsyncTestClient[Litestar], app: Litestar, manager: TransactionManager, cache: StrCache
+) -> None:
+    seeded = await _count_rows(manager)
+
+    await create_rules(collect_rules(app))(app)
+
+    assert await cache.get(RULES_KEY) == RULES_DONE
+    assert await _count_rows(manager) == seeded